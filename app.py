@@ -1,69 +1,242 @@
-import json
+import atexit
+import functools
+import mmap
 import os
+import signal
+import sys
+import threading
+import time
 import uuid
 from datetime import datetime
-
-from flask import Flask, request, jsonify
+from typing import Annotated
+
+import msgpack
+import msgspec
+import orjson
+from sortedcontainers import SortedKeyList
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.exceptions import BadRequest, NotFound, InternalServerError
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that encodes and decodes with orjson, so jsonify and request.get_json
+    skip the stdlib json module. datetime objects are emitted as ISO format strings.
+    """
+
+    def dumps(self, obj, **kwargs):
+        # Formatting kwargs (indent, sort_keys) are ignored; anything orjson can't
+        # serialize natively falls back to Flask's default handler.
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # --- Persistence Configuration ---
-EVENTS_FILE = 'events.json'
+EVENTS_FILE = 'events.msgpack'
+LEGACY_EVENTS_FILE = 'events.json' # Pre-MessagePack snapshot, migrated on first load
+QUARANTINE_FILE = 'events.quarantine.log' # Events set aside at load because their times are unusable
+EVENTS_LOG = 'events.log' # Append-only journal of mutations since the last snapshot
+COMPACT_RATIO = 10 # Compact once the log grows past this multiple of the snapshot size
+COMPACT_MIN_BYTES = 64 * 1024 # ...but never for a log smaller than this
+
+_log_file = None # Module-level append handle for EVENTS_LOG, opened lazily
+_snapshot_size = 0 # Size of EVENTS_FILE as of the last load/compaction
+
+FLUSH_DELAY = 0.2 # Seconds to let mutations accumulate before a journal write
+_pending_records = [] # Serialized journal lines not yet written to EVENTS_LOG
+_journal_lock = threading.RLock() # Guards _pending_records, _log_file and _snapshot_size
+_flush_event = threading.Event() # Set when _pending_records has something to write
+
+class _UUIDPool:
+    """
+    Hands out random (version 4) UUID strings, reading entropy for `n` IDs
+    per os.urandom call instead of one syscall per ID.
+    """
 
-def load_events():
+    def __init__(self, n=256):
+        self._buf = b''
+        self._pos = 0
+        self._n = n
+        self._lock = threading.Lock()
+
+    def next(self):
+        with self._lock:
+            if self._pos + 16 > len(self._buf):
+                self._buf = os.urandom(16 * self._n)
+                self._pos = 0
+            u = self._buf[self._pos:self._pos + 16]
+            self._pos += 16
+        # version=4 sets the version and variant bits, exactly as uuid.uuid4() does
+        return str(uuid.UUID(bytes=u, version=4))
+
+_uuid_pool = _UUIDPool()
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(s):
     """
-    Loads events from the JSON file.
-    Converts 'start_time' and 'end_time' strings to datetime objects.
-    Assigns a unique ID if an event loaded from file doesn't have one.
+    Parses an ISO 8601 string into a datetime, memoized since timestamps repeat often.
+    datetime objects are immutable, so sharing cached instances is safe.
+    Raises ValueError (or TypeError for non-strings) like datetime.fromisoformat.
+    """
+    return datetime.fromisoformat(s)
+
+def _restore_event(event):
+    """
+    Prepares an event read from disk for in-memory use.
+    Assigns a unique ID if missing and converts time strings to datetime objects.
+    Interns title and description so events that repeat them share one string object.
+    Returns None (after quarantining the event) if it isn't a dict or its times are missing
+    or not naive datetimes, since such an event can't be ordered in sorted_events.
+    """
+    if not isinstance(event, dict):
+        print(f"Warning: Event record is not an object: {event!r}")
+        _quarantine_event(event)
+        return None
+    if 'id' not in event: # Assign ID if missing (for backward compatibility)
+        event['id'] = _uuid_pool.next()
+    for field in ('title', 'description'):
+        if isinstance(event.get(field), str):
+            event[field] = sys.intern(event[field])
+    try:
+        event['start_time'] = _parse_iso(event['start_time'])
+        event['end_time'] = _parse_iso(event['end_time'])
+    except (KeyError, ValueError, TypeError) as e:
+        print(f"Warning: Malformed time data in event ID {event.get('id', 'N/A')}: {e!r}")
+        _quarantine_event(event)
+        return None
+    if event['start_time'].tzinfo is not None or event['end_time'].tzinfo is not None:
+        print(f"Warning: Timezone-aware time data in event ID {event['id']}")
+        _quarantine_event(event)
+        return None
+    return event
+
+def _quarantine_event(event):
+    """
+    Appends an unusable event to QUARANTINE_FILE so skipping it at load doesn't lose it
+    once the next compaction rewrites the snapshot without it.
+    """
+    try:
+        with open(QUARANTINE_FILE, 'ab') as f:
+            f.write(orjson.dumps(event) + b'\n')
+    except Exception as e:
+        print(f"Error writing event to {QUARANTINE_FILE}: {e}")
+
+def _load_legacy_snapshot():
+    """
+    Loads events from the legacy JSON snapshot, if there is one.
     Handles file not found or JSON decoding errors gracefully.
     """
+    if not os.path.exists(LEGACY_EVENTS_FILE) or os.stat(LEGACY_EVENTS_FILE).st_size==0:
+        return []
+
+    try:
+        with open(LEGACY_EVENTS_FILE, 'rb') as f:
+            return orjson.loads(f.read())
+    except orjson.JSONDecodeError as e:
+        print(f"Error decoding JSON from {LEGACY_EVENTS_FILE}: {e}")
+        return []
+    except Exception as e:
+        print(f"An unexpected error occurred while loading events: {e}")
+        return []
+
+def _load_snapshot():
+    """
+    Loads the event snapshot from the MessagePack file.
+    If only a legacy JSON snapshot exists, loads that and migrates it to MessagePack once.
+    Handles file not found or decoding errors gracefully.
+    """
+    global _snapshot_size
     if not os.path.exists(EVENTS_FILE) or os.stat(EVENTS_FILE).st_size==0:
-        return [] # Return empty list if file doesn't exist or is empty
-    
+        events_data = [event for event in map(_restore_event, _load_legacy_snapshot()) if event is not None]
+        if events_data:
+            try:
+                save_events(events_data)
+                _snapshot_size = os.stat(EVENTS_FILE).st_size
+                print(f"Migrated {len(events_data)} events from {LEGACY_EVENTS_FILE} to {EVENTS_FILE}")
+            except Exception as e:
+                print(f"Warning: Could not migrate {LEGACY_EVENTS_FILE} to {EVENTS_FILE}: {e}")
+        return events_data
+
     try:
-        with open(EVENTS_FILE, 'r') as f:
-            events_data = json.load(f)
-            # Ensure each event has an ID and convert time strings back to datetime objects
-            for event in events_data:
-                if 'id' not in event: # Assign ID if missing (for backward compatibility)
-                    event['id'] = str(uuid.uuid4())
-                try:
-                    event['start_time'] = datetime.fromisoformat(event['start_time'])
-                    event['end_time'] = datetime.fromisoformat(event['end_time'])
-                except (ValueError, TypeError) as e:
-                    print(f"Warning: Malformed time data in event ID {event.get('id', 'N/A')}: {e}")
-                    # If time data is malformed, you might want to handle it specifically,
-                    # e.g., set to None or a default, or skip the event.
-            return events_data
-    except json.JSONDecodeError as e:
-        print(f"Error decoding JSON from {EVENTS_FILE}: {e}")
+        # Unpack straight from a read-only memory map rather than reading the file into a bytes copy
+        with open(EVENTS_FILE, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            _snapshot_size = len(mm)
+            events_data = msgpack.unpackb(mm, raw=False)
+        return [event for event in map(_restore_event, events_data) if event is not None]
+    except ValueError as e: # msgpack's unpack errors are ValueError subclasses
+        print(f"Error decoding MessagePack from {EVENTS_FILE}: {e}")
         return []
     except Exception as e:
         print(f"An unexpected error occurred while loading events: {e}")
         return []
 
+def _replay_log(events_by_id):
+    """
+    Applies the operations recorded in the journal to `events_by_id`, in order.
+    Replay is idempotent, and compact() writes every queued record before the snapshot,
+    so a log left over from an interrupted compaction replays to the snapshot's state.
+    A malformed record, such as a torn trailing line from a crash mid-write, is skipped
+    with a warning without affecting the records after it.
+    """
+    if not os.path.exists(EVENTS_LOG):
+        return
+
+    try:
+        with open(EVENTS_LOG, 'rb') as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = orjson.loads(line)
+                    if record.get('op')=='put':
+                        event = _restore_event(record['event'])
+                        if event is not None:
+                            events_by_id[event['id']] = event
+                    elif record.get('op')=='del':
+                        events_by_id.pop(record['id'], None)
+                except Exception as e:
+                    print(f"Warning: Skipping malformed record on line {line_no} of {EVENTS_LOG}: {e!r}")
+    except Exception as e:
+        print(f"An unexpected error occurred while replaying {EVENTS_LOG}: {e}")
+
+def load_events():
+    """
+    Loads events from the MessagePack snapshot and replays the journal on top of it.
+    Converts 'start_time' and 'end_time' strings to datetime objects.
+    Returns a dict of events keyed by ID, in insertion order.
+    """
+    events_by_id = {event['id']: event for event in _load_snapshot()}
+    _replay_log(events_by_id)
+    return events_by_id
+
+def _msgpack_default(obj):
+    """Packs datetime objects as ISO format strings; other unknown types are an error."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not MessagePack serializable")
+
 def save_events(events):
     """
-    Saves events to the JSON file.
-    Converts datetime objects to ISO format strings for JSON serialization.
+    Saves events to the MessagePack file.
+    datetime objects are stored as ISO format strings, matching the journal.
+    Writes to a temp file and renames it over EVENTS_FILE, so a crash never leaves a torn snapshot.
     Handles potential file writing errors.
     """
+    tmp_file = EVENTS_FILE + '.tmp'
     try:
-        serializable_events = []
-        for event in events:
-            serializable_event = event.copy()
-            # Convert datetime objects to ISO format strings
-            if isinstance(serializable_event.get('start_time'), datetime):
-                serializable_event['start_time'] = serializable_event['start_time'].isoformat()
-            if isinstance(serializable_event.get('end_time'), datetime):
-                serializable_event['end_time'] = serializable_event['end_time'].isoformat()
-            serializable_events.append(serializable_event)
-        
-        with open(EVENTS_FILE, 'w') as f:
-            json.dump(serializable_events, f, indent=4)
+        with open(tmp_file, 'wb') as f:
+            f.write(msgpack.packb(events, default=_msgpack_default))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, EVENTS_FILE)
     except TypeError as e:
-        print(f"Error during JSON serialization (possible non-serializable data): {e}")
+        print(f"Error during MessagePack serialization (possible non-serializable data): {e}")
         raise InternalServerError("Failed to save events due to data serialization error.")
     except IOError as e:
         print(f"Error writing to file {EVENTS_FILE}: {e}")
@@ -72,70 +245,220 @@ def save_events(events):
         print(f"An unexpected error occurred while saving events: {e}")
         raise InternalServerError("Failed to save events due to an unexpected error.")
 
+def compact(events_by_id):
+    """
+    Rewrites the MessagePack snapshot from `events_by_id` and truncates the journal.
+    Queued records are written to the journal first, so the journal always ends in the
+    same state as the snapshot; a crash after the snapshot but before the truncation
+    then only leaves a log whose replay reproduces the snapshot.
+    Takes events_lock so no mutation can land between the snapshot and the truncation.
+    """
+    global _log_file, _snapshot_size
+    with events_lock, _journal_lock:
+        try:
+            _write_pending_records()
+        except IOError as e:
+            print(f"Error writing to file {EVENTS_LOG}: {e}")
+            raise InternalServerError("Failed to compact events due to file system error.")
+        save_events(list(events_by_id.values()))
+        _snapshot_size = os.stat(EVENTS_FILE).st_size
+        try:
+            if _log_file is not None:
+                _log_file.close()
+            _log_file = open(EVENTS_LOG, 'wb') # Truncates the log; later appends reuse this handle
+        except IOError as e:
+            _log_file = None
+            print(f"Error truncating {EVENTS_LOG}: {e}")
+            raise InternalServerError("Failed to compact events due to file system error.")
+
+def append_event_op(op, payload):
+    """
+    Queues a single mutation for the journal and wakes the background flusher.
+    `op` is 'put' (payload is the full event) or 'del' (payload is the event ID).
+    The record is serialized immediately so later in-memory changes can't leak into it.
+    """
+    record = {'op': op, 'event': payload} if op=='put' else {'op': op, 'id': payload}
+    try:
+        line = orjson.dumps(record) + b'\n'
+    except orjson.JSONEncodeError as e:
+        print(f"Error during JSON serialization (possible non-serializable data): {e}")
+        raise InternalServerError("Failed to save events due to data serialization error.")
 
-# Load events when the application starts
-events = load_events()
+    with _journal_lock:
+        _pending_records.append(line)
+    _flush_event.set()
 
-# --- Helper Functions ---
-def validate_event_data(data, is_update=False):
+def _write_pending_records():
     """
-    Validates incoming event data for creation or update.
-    Returns (True, None) for valid data, or (False, error_messages_list) for invalid data.
-    `is_update` allows partial data for PUT requests.
+    Writes all queued records to the journal with a single write and fsync, then
+    clears the queue. Returns the journal size. Caller must hold _journal_lock.
+    Raises IOError on failure, leaving the records queued.
     """
-    errors = []
-    
-    # For creation, all required fields must be present
-    if not is_update:
-        required_fields = ['title', 'description', 'start_time', 'end_time']
-        for field in required_fields:
-            if field not in data:
-                errors.append(f"Missing required field: '{field}'")
-    
-    # Validate title if present
-    if 'title' in data:
-        if not isinstance(data['title'], str) or not data['title'].strip():
-            errors.append("Title must be a non-empty string.")
-            
-    # Validate description if present
-    if 'description' in data:
-        if not isinstance(data['description'], str):
-            errors.append("Description must be a string.")
-
-    start_time_str = data.get('start_time')
-    end_time_str = data.get('end_time')
-
-    # Validate and parse start_time if present
-    parsed_start_time = None
-    if start_time_str is not None:
-        if not isinstance(start_time_str, str):
-            errors.append("start_time must be a string.")
-        else:
-            try:
-                parsed_start_time = datetime.fromisoformat(start_time_str)
-            except ValueError:
-                errors.append("Invalid start_time format. Use ISO 8601 (YYYY-MM-DDTHH:MM:SS).")
-
-    # Validate and parse end_time if present
-    parsed_end_time = None
-    if end_time_str is not None:
-        if not isinstance(end_time_str, str):
-            errors.append("end_time must be a string.")
-        else:
+    global _log_file
+    try:
+        if _log_file is None:
+            _log_file = open(EVENTS_LOG, 'ab')
+            if _log_file.tell() > 0:
+                _log_file.write(b'\n') # Terminate any torn trailing record
+        if _pending_records:
+            _log_file.write(b''.join(_pending_records))
+            _log_file.flush()
+            os.fsync(_log_file.fileno())
+            _pending_records.clear()
+        return _log_file.tell()
+    except IOError:
+        # Part of the batch may already be in the file (or stuck in the buffer). Drop the
+        # handle so the retry reopens the log and terminates that torn line first;
+        # replaying a record twice is harmless since replay is idempotent.
+        if _log_file is not None:
             try:
-                parsed_end_time = datetime.fromisoformat(end_time_str)
-            except ValueError:
-                errors.append("Invalid end_time format. Use ISO 8601 (YYYY-MM-DDTHH:MM:SS).")
-    
-    # Return parsed times alongside validity status for convenience
-    return len(errors)==0, errors, parsed_start_time, parsed_end_time
+                _log_file.close()
+            except IOError:
+                pass
+            _log_file = None
+        raise
+
+def flush_journal():
+    """
+    Writes all queued records to the journal with a single write and fsync.
+    Compacts the journal into the snapshot once it outgrows COMPACT_RATIO.
+    On a write error the records stay queued and are retried on the next flush.
+    """
+    with _journal_lock:
+        if not _pending_records:
+            return
+        try:
+            log_size = _write_pending_records()
+        except IOError as e:
+            print(f"Error writing to file {EVENTS_LOG}: {e}")
+            return
+        needs_compaction = log_size > max(COMPACT_RATIO * _snapshot_size, COMPACT_MIN_BYTES)
+
+    # Compact outside _journal_lock: compact() takes events_lock first, like the endpoints do
+    if needs_compaction:
+        compact(events_by_id)
+
+def _flush_loop():
+    """
+    Background flusher: after a write is signalled, waits FLUSH_DELAY so a burst
+    of mutations coalesces into one journal write.
+    """
+    while True:
+        _flush_event.wait()
+        time.sleep(FLUSH_DELAY)
+        _flush_event.clear()
+        try:
+            flush_journal()
+        except Exception as e:
+            print(f"An unexpected error occurred while flushing events: {e}")
+
+def final_flush():
+    """Flushes any queued records on interpreter shutdown (atexit) or SIGTERM."""
+    try:
+        flush_journal()
+    except Exception as e:
+        print(f"An unexpected error occurred while flushing events on shutdown: {e}")
+
+_previous_sigterm_handler = None # Whatever handled SIGTERM before us, e.g. a host server's graceful shutdown
+
+def _handle_sigterm(signum, frame):
+    """
+    atexit hooks don't run when a process is killed by SIGTERM, which is how most
+    process managers stop a service, so flush queued records here first.
+    Then defers to the handler that was installed before this one; with no Python
+    handler (the default action) it exits, as SIGTERM would have.
+    """
+    final_flush()
+    if callable(_previous_sigterm_handler):
+        _previous_sigterm_handler(signum, frame)
+    elif _previous_sigterm_handler!=signal.SIG_IGN:
+        sys.exit(128 + signum)
+
+
+# Load events when the application starts, indexed by ID for O(1) lookups
+events_by_id = load_events()
+# Guards events_by_id, sorted_events and the response caches below; mutations also
+# queue their journal record under it so the journal order matches the in-memory order
+events_lock = threading.RLock()
+# The same events kept ordered by start_time, so listing never has to sort; like the
+# stable sort it replaces, events with equal start times stay in insertion order
+sorted_events = SortedKeyList(events_by_id.values(), key=lambda event: event['start_time'])
+
+# Persist queued mutations in the background, and whatever is left on shutdown
+threading.Thread(target=_flush_loop, name='events-flusher', daemon=True).start()
+atexit.register(final_flush)
+if threading.current_thread() is threading.main_thread(): # signal handlers can only be set from the main thread
+    _previous_sigterm_handler = signal.getsignal(signal.SIGTERM)
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+
+# Serialized GET /events body; rebuilt lazily and reset by every mutating endpoint
+_cached_list_bytes = None
+# Serialized JSON of each event, keyed by ID; entries are dropped when the event changes
+_event_json_cache = {}
+
+# --- Request Schemas ---
+# Stored event times are naive, so timezone-aware times are rejected up front
+# rather than failing later when they are compared with the stored ones
+NaiveDatetime = Annotated[datetime, msgspec.Meta(tz=False)]
+
+class EventIn(msgspec.Struct):
+    """Body of a POST /events request; every field is required."""
+    title: str
+    description: str
+    start_time: NaiveDatetime
+    end_time: NaiveDatetime
+
+class EventPatch(msgspec.Struct):
+    """Body of a PUT /events/<event_id> request; fields left out stay UNSET."""
+    title: str | msgspec.UnsetType = msgspec.UNSET
+    description: str | msgspec.UnsetType = msgspec.UNSET
+    start_time: NaiveDatetime | msgspec.UnsetType = msgspec.UNSET
+    end_time: NaiveDatetime | msgspec.UnsetType = msgspec.UNSET
+
+# --- Helper Functions ---
+def decode_event_data(raw, is_update=False):
+    """
+    Parses and validates a raw JSON request body for creation or update in one pass.
+    Returns an EventIn (creation) or EventPatch (`is_update`, partial data for PUT requests).
+    Raises BadRequest describing the first problem found.
+    """
+    if not raw.strip():
+        raise BadRequest("Request body must be JSON.")
+
+    try:
+        data = msgspec.json.decode(raw, type=EventPatch if is_update else EventIn)
+    except msgspec.ValidationError as e:
+        message = str(e)
+        if 'datetime' in message:
+            message += ". Use ISO 8601 (YYYY-MM-DDTHH:MM:SS)."
+        raise BadRequest(message)
+    except msgspec.DecodeError:
+        raise BadRequest("Request body must be JSON.")
+
+    if is_update and all(getattr(data, field) is msgspec.UNSET for field in data.__struct_fields__):
+        raise BadRequest(f"Request body must include at least one of: {', '.join(data.__struct_fields__)}.")
+    if data.title is not msgspec.UNSET and not data.title.strip():
+        raise BadRequest("Title must be a non-empty string.")
+    return data
+
+def event_json(event):
+    """Returns the event serialized as JSON bytes, reusing the cached fragment if it is current."""
+    fragment = _event_json_cache.get(event['id'])
+    if fragment is None:
+        fragment = _event_json_cache[event['id']] = orjson.dumps(event)
+    return fragment
+
+def event_response(message, event, status):
+    """
+    Builds a {"message", "event"} JSON response by splicing in the event's cached
+    fragment, instead of building and encoding a fresh dict.
+    """
+    body = b'{"message":' + orjson.dumps(message) + b',"event":' + event_json(event) + b'}'
+    return Response(body, status=status, mimetype='application/json')
 
 def get_event_by_id(event_id):
-    """Finds an event by its ID in the global events list."""
-    for event in events:
-        if event['id']==event_id:
-            return event
-    return None
+    """Finds an event by its ID in the global events index."""
+    return events_by_id.get(event_id)
 
 # --- Custom Error Handlers ---
 @app.errorhandler(400)
@@ -170,36 +493,31 @@ def create_event():
     Requires title, description, start_time, and end_time in ISO 8601 format.
     Returns 201 Created on success, 400 Bad Request on validation error.
     """
+    global _cached_list_bytes
     try:
-        data = request.get_json()
-        if not data:
-            raise BadRequest("Request body must be JSON.")
+        data = decode_event_data(request.get_data(), is_update=False)
 
-        is_valid, errors, parsed_start_time, parsed_end_time = validate_event_data(data, is_update=False)
-        if not is_valid:
-            raise BadRequest(", ".join(errors))
-        
         # Additional check for full time validation on creation as both times must be present
-        if parsed_start_time >= parsed_end_time:
+        if data.start_time >= data.end_time:
             raise BadRequest("Start time must be strictly before end time.")
 
         new_event = {
-            'id': str(uuid.uuid4()),  # Generate a unique ID
-            'title': data['title'].strip(),
-            'description': data['description'].strip(),
-            'start_time': parsed_start_time,
-            'end_time': parsed_end_time
+            'id': _uuid_pool.next(),  # Generate a unique ID
+            'title': data.title.strip(),
+            'description': data.description.strip(),
+            'start_time': data.start_time,
+            'end_time': data.end_time
         }
         
-        events.append(new_event)
-        save_events(events) # Persist the new event
-
-        # Prepare response (convert datetime objects back to string for JSON)
-        response_event = new_event.copy()
-        response_event['start_time'] = response_event['start_time'].isoformat()
-        response_event['end_time'] = response_event['end_time'].isoformat()
+        with events_lock:
+            # Add to sorted_events first: it is the step that compares start times and
+            # can fail, and a failure must not leave the event half-inserted
+            sorted_events.add(new_event)
+            events_by_id[new_event['id']] = new_event
+            _cached_list_bytes = None
+            append_event_op('put', new_event) # Persist the new event
 
-        return jsonify({"message": "Event created successfully", "event": response_event}), 201
+            return event_response("Event created successfully", new_event, 201)
 
     except BadRequest as e:
         return jsonify({"error": "Bad Request", "message": e.description}), 400
@@ -213,20 +531,18 @@ def list_events():
     """
     Retrieves all scheduled events, sorted by start_time (earliest first).
     Returns 200 OK.
+    The serialized body is cached until the next create/update/delete.
     """
+    global _cached_list_bytes
     try:
-        # Sort events by start_time
-        sorted_events = sorted(events, key=lambda event: event['start_time'])
-        
-        # Prepare events for JSON response (convert datetime objects to string)
-        response_events = []
-        for event in sorted_events:
-            response_event = event.copy()
-            response_event['start_time'] = response_event['start_time'].isoformat()
-            response_event['end_time'] = response_event['end_time'].isoformat()
-            response_events.append(response_event)
-
-        return jsonify({"events": response_events}), 200
+        # Read the cache once: a concurrent write may reset it at any point
+        body = _cached_list_bytes
+        if body is None:
+            with events_lock:
+                # sorted_events is already ordered by start_time, so just stitch the per-event fragments
+                body = _cached_list_bytes = b'{"events":[' + b','.join(event_json(event) for event in sorted_events) + b']}'
+
+        return Response(body, status=200, mimetype='application/json')
     except Exception as e:
         print(f"Error listing events: {e}") # Log the actual error
         raise InternalServerError("An unexpected error occurred while listing events.")
@@ -239,54 +555,54 @@ def update_event(event_id):
     Allows partial updates of title, description, start_time, and end_time.
     Returns 200 OK on success, 400 Bad Request on validation error, 404 Not Found if event doesn't exist.
     """
+    global _cached_list_bytes
     try:
-        data = request.get_json()
-        if not data:
-            raise BadRequest("Request body must be JSON.")
-
         # Validate incoming data, allowing partial updates.
-        # This will return parsed_start_time and parsed_end_time only if they were in the request.
-        is_valid, errors, parsed_req_start_time, parsed_req_end_time = validate_event_data(data, is_update=True)
-        if not is_valid:
-            raise BadRequest(", ".join(errors))
-
-        # Find the event by ID
-        event_index = -1
-        for i, event in enumerate(events):
-            if event['id']==event_id:
-                event_to_update = event
-                event_index = i
-                break
-        
-        if event_index==-1:
-            raise NotFound(f"Event with ID '{event_id}' not found.")
-
-        # Apply updates from the request data
-        if 'title' in data:
-            event_to_update['title'] = data['title'].strip()
-        if 'description' in data:
-            event_to_update['description'] = data['description'].strip()
-        
-        # Update times only if they were provided in the request AND successfully parsed
-        if parsed_req_start_time:
-            event_to_update['start_time'] = parsed_req_start_time
-        if parsed_req_end_time:
-            event_to_update['end_time'] = parsed_req_end_time
-        
-        # After potential updates, re-validate the time logic of the combined (new + old) times
-        # This catches cases where one time was updated, making the event invalid
-        if event_to_update['start_time'] >= event_to_update['end_time']:
-            raise BadRequest("Updated start time must be strictly before updated end time.")
-
-        # No need to explicitly replace, as event_to_update is a reference to the item in `events` list
-        save_events(events) # Persist the updated event list
-
-        # Prepare response (convert datetime objects back to string for JSON)
-        response_event = event_to_update.copy()
-        response_event['start_time'] = response_event['start_time'].isoformat()
-        response_event['end_time'] = response_event['end_time'].isoformat()
-
-        return jsonify({"message": "Event updated successfully", "event": response_event}), 200
+        # Fields missing from the request are left as msgspec.UNSET, which is falsy.
+        data = decode_event_data(request.get_data(), is_update=True)
+
+        with events_lock:
+            # Find the event by ID
+            event_to_update = get_event_by_id(event_id)
+            if event_to_update is None:
+                raise NotFound(f"Event with ID '{event_id}' not found.")
+
+            # Use times only if they were provided in the request
+            new_start_time = data.start_time or event_to_update['start_time']
+            new_end_time = data.end_time or event_to_update['end_time']
+
+            # Validate the time logic of the combined (new + old) times before touching the event
+            # This catches cases where one time was updated, making the event invalid
+            if new_start_time >= new_end_time:
+                raise BadRequest("Updated start time must be strictly before updated end time.")
+
+            # Apply updates from the request data, tracking whether anything actually changed
+            changed = False
+            if data.title is not msgspec.UNSET and event_to_update['title']!=data.title.strip():
+                event_to_update['title'] = data.title.strip()
+                changed = True
+            if data.description is not msgspec.UNSET and event_to_update['description']!=data.description.strip():
+                event_to_update['description'] = data.description.strip()
+                changed = True
+            if new_start_time!=event_to_update['start_time']:
+                # The sort key changes, so reposition the event in sorted_events
+                sorted_events.remove(event_to_update)
+                event_to_update['start_time'] = new_start_time
+                sorted_events.add(event_to_update)
+                changed = True
+            if new_end_time!=event_to_update['end_time']:
+                event_to_update['end_time'] = new_end_time
+                changed = True
+
+            # Idempotent PUTs that change nothing skip the caches and the journal write
+            if changed:
+                _event_json_cache.pop(event_id, None)
+                _cached_list_bytes = None
+
+                # No need to explicitly replace, as event_to_update is a reference to the item in `events_by_id`
+                append_event_op('put', event_to_update) # Persist the updated event
+
+            return event_response("Event updated successfully", event_to_update, 200)
 
     except BadRequest as e:
         return jsonify({"error": "Bad Request", "message": e.description}), 400
@@ -302,21 +618,18 @@ def delete_event(event_id):
     #Deletes an event identified by event_id.
     #Returns 200 OK on success, 404 Not Found if event doesn't exist.
     
-    global events # Declare 'events' as global to modify the list in place
+    global _cached_list_bytes
     try:
-        # Find the event by ID and its index
-        event_index_to_delete = -1
-        for i, event in enumerate(events):
-            if event['id']==event_id:
-                event_index_to_delete = i
-                break
-        
-        if event_index_to_delete==-1:
-            raise NotFound(f"Event with ID '{event_id}' not found.")
-
-        # Remove the event from the list
-        deleted_event = events.pop(event_index_to_delete)
-        save_events(events) # Persist the updated event list
+        with events_lock:
+            # Remove the event from the index
+            deleted_event = events_by_id.pop(event_id, None)
+            if deleted_event is None:
+                raise NotFound(f"Event with ID '{event_id}' not found.")
+            sorted_events.remove(deleted_event)
+            _event_json_cache.pop(event_id, None)
+            _cached_list_bytes = None
+
+            append_event_op('del', event_id) # Persist the deletion
 
         return jsonify({"message": f"Event '{deleted_event['title']}' with ID '{event_id}' deleted successfully"}), 200
 
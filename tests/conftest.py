@@ -0,0 +1,34 @@
+import importlib
+import os
+import signal
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def load_app(tmp_path, monkeypatch):
+    """
+    Returns a function that imports a fresh copy of app.py with tmp_path as the
+    working directory, the way a restarted process would load its data files.
+    """
+    monkeypatch.chdir(tmp_path)
+    previous_sigterm = signal.getsignal(signal.SIGTERM)
+    loaded = []
+
+    def _load():
+        sys.modules.pop('app', None)
+        module = importlib.import_module('app')
+        loaded.append(module)
+        return module
+
+    yield _load
+
+    for module in loaded:
+        module._pending_records.clear() # Nothing left for the atexit hook to write
+        if module._log_file is not None:
+            module._log_file.close()
+    sys.modules.pop('app', None)
+    signal.signal(signal.SIGTERM, previous_sigterm)
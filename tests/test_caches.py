@@ -0,0 +1,54 @@
+EVENT = {
+    'title': 'Daily Standup',
+    'description': 'Quick team sync.',
+    'start_time': '2030-01-01T09:00:00',
+    'end_time': '2030-01-01T09:15:00',
+}
+
+
+def setup_events(load_app, monkeypatch):
+    app = load_app()
+    monkeypatch.setattr(app, 'FLUSH_DELAY', 60) # Keep the background flusher out of the way
+    client = app.app.test_client()
+    ids = [client.post('/events', json={**EVENT, 'title': title}).get_json()['event']['id'] for title in ('a', 'b')]
+    app.flush_journal()
+    return app, client, ids
+
+
+def listed(client):
+    response = client.get('/events')
+    assert response.status_code==200
+    return {event['id']: event for event in response.get_json()['events']}
+
+
+def test_noop_put_writes_nothing(load_app, monkeypatch):
+    app, client, (event_id, _) = setup_events(load_app, monkeypatch)
+    listed(client) # Warm both caches
+    list_bytes = app._cached_list_bytes
+
+    response = client.put(f'/events/{event_id}', json={**EVENT, 'title': ' a '})
+    assert response.status_code==200
+    assert response.get_json()['event']['title']=='a'
+    assert app._pending_records==[]
+    assert app._cached_list_bytes is list_bytes
+
+
+def test_put_invalidates_list_and_event_caches(load_app, monkeypatch):
+    app, client, (event_id, other_id) = setup_events(load_app, monkeypatch)
+    listed(client) # Warm both caches
+    assert app._cached_list_bytes is not None and event_id in app._event_json_cache
+
+    assert client.put(f'/events/{event_id}', json={'title': 'renamed'}).status_code==200
+    events = listed(client)
+    assert events[event_id]['title']=='renamed'
+    assert events[other_id]['title']=='b'
+    assert app._pending_records # The change was queued for the journal
+
+
+def test_delete_invalidates_list_and_event_caches(load_app, monkeypatch):
+    app, client, (event_id, other_id) = setup_events(load_app, monkeypatch)
+    listed(client) # Warm both caches
+
+    assert client.delete(f'/events/{event_id}').status_code==200
+    assert set(listed(client))=={other_id}
+    assert event_id not in app._event_json_cache
@@ -0,0 +1,176 @@
+import os
+import signal
+
+import orjson
+import pytest
+
+EVENT = {
+    'title': 'Daily Standup',
+    'description': 'Quick team sync.',
+    'start_time': '2030-01-01T09:00:00',
+    'end_time': '2030-01-01T09:15:00',
+}
+
+
+class Crash(Exception):
+    """Stands in for the process dying at a chosen point."""
+
+
+def create(app, **fields):
+    response = app.app.test_client().post('/events', json={**EVENT, **fields})
+    assert response.status_code==201, response.data
+    return response.get_json()['event']['id']
+
+
+def titles(app):
+    return sorted(event['title'] for event in app.events_by_id.values())
+
+
+def test_replay_after_restart(load_app):
+    app = load_app()
+    client = app.app.test_client()
+    kept = create(app, title='kept')
+    updated = create(app, title='v1', start_time='2030-01-01T09:05:00')
+    deleted = create(app, title='deleted')
+    assert client.put(f'/events/{updated}', json={'title': 'v2'}).status_code==200
+    assert client.delete(f'/events/{deleted}').status_code==200
+    app.flush_journal()
+    assert not os.path.exists(app.EVENTS_FILE) # Everything so far lives only in the journal
+
+    restarted = load_app()
+    assert set(restarted.events_by_id)=={kept, updated}
+    assert restarted.events_by_id[updated]['title']=='v2'
+    assert [event['id'] for event in restarted.sorted_events]==[kept, updated]
+
+
+def test_torn_last_line_is_skipped_and_later_appends_survive(load_app):
+    app = load_app()
+    first = create(app, title='first')
+    app.flush_journal()
+    app._log_file.close()
+    with open(app.EVENTS_LOG, 'ab') as f:
+        f.write(b'{"op":"put","event":{"id":"torn","ti') # Crash mid-write
+
+    restarted = load_app()
+    assert set(restarted.events_by_id)=={first}
+    second = create(restarted, title='second')
+    restarted.flush_journal()
+
+    assert set(load_app().events_by_id)=={first, second}
+
+
+def test_compaction_at_threshold(load_app, monkeypatch):
+    app = load_app()
+    monkeypatch.setattr(app, 'COMPACT_MIN_BYTES', 0)
+    monkeypatch.setattr(app, 'COMPACT_RATIO', 10)
+    create(app, title='first')
+    app.flush_journal() # No snapshot yet, so any journal outgrows it
+    assert os.path.exists(app.EVENTS_FILE)
+    assert os.path.getsize(app.EVENTS_LOG)==0
+
+    # Stay below COMPACT_RATIO x the snapshot size: the journal just grows
+    create(app, title='second')
+    app.flush_journal()
+    log_size = os.path.getsize(app.EVENTS_LOG)
+    assert 0 < log_size <= 10 * app._snapshot_size
+
+    while os.path.getsize(app.EVENTS_LOG) > 0:
+        create(app, title='more')
+        app.flush_journal()
+    assert os.path.getsize(app.EVENTS_LOG)==0
+
+    restarted = load_app()
+    assert titles(restarted)==titles(app)
+
+
+def test_crash_between_snapshot_and_truncation(load_app, monkeypatch):
+    app = load_app()
+    client = app.app.test_client()
+    event_id = create(app, title='v1')
+    app.flush_journal()
+    assert client.put(f'/events/{event_id}', json={'title': 'v2'}).status_code==200 # Still queued
+
+    save_events = app.save_events
+    def save_then_crash(events):
+        save_events(events)
+        raise Crash()
+    monkeypatch.setattr(app, 'save_events', save_then_crash)
+    with pytest.raises(Crash):
+        app.compact(app.events_by_id)
+
+    restarted = load_app()
+    assert restarted.events_by_id[event_id]['title']=='v2'
+
+
+def test_aware_start_time_is_rejected_without_a_trace(load_app):
+    app = load_app()
+    create(app, title='naive')
+    client = app.app.test_client()
+    response = client.post('/events', json={**EVENT, 'start_time': '2030-01-01T10:00:00Z'})
+    assert response.status_code==400
+    assert len(app.events_by_id)==len(app.sorted_events)==1
+
+
+def test_equal_start_times_list_in_creation_order(load_app):
+    app = load_app()
+    created = [create(app, title=str(i)) for i in range(5)]
+    events = app.app.test_client().get('/events').get_json()['events']
+    assert [event['id'] for event in events]==created
+
+
+def test_sigterm_flushes_then_defers_to_previous_handler(load_app, monkeypatch):
+    received = []
+    signal.signal(signal.SIGTERM, lambda signum, frame: received.append(signum)) # e.g. a host server's handler
+    app = load_app()
+    monkeypatch.setattr(app, 'FLUSH_DELAY', 60) # Keep the background flusher out of the way
+    event_id = create(app)
+    assert app._pending_records
+
+    os.kill(os.getpid(), signal.SIGTERM)
+
+    assert received==[signal.SIGTERM]
+    assert not app._pending_records
+    with open(app.EVENTS_LOG, 'rb') as f:
+        assert event_id.encode() in f.read()
+
+
+def test_retry_after_partial_write_terminates_the_torn_line(load_app, monkeypatch):
+    app = load_app()
+    monkeypatch.setattr(app, 'FLUSH_DELAY', 60) # Keep the background flusher out of the way
+    first = create(app, title='first')
+    app.flush_journal()
+
+    class DiskFull:
+        """Wraps the log handle, writing half of the next batch before failing."""
+        def __init__(self, f):
+            self.f = f
+        def write(self, data):
+            self.f.write(data[:len(data) // 2])
+            self.f.flush()
+            raise OSError(28, 'No space left on device')
+        def __getattr__(self, name):
+            return getattr(self.f, name)
+
+    app._log_file = DiskFull(app._log_file)
+    second = create(app, title='second')
+    app.flush_journal()
+    assert app._pending_records # Still queued for the retry
+    assert app._log_file is None
+
+    app.flush_journal()
+    assert set(load_app().events_by_id)=={first, second}
+
+
+def test_bad_records_do_not_stop_replay(tmp_path, load_app):
+    good = {'op': 'put', 'event': {'id': 'good', **EVENT}}
+    (tmp_path / 'events.log').write_bytes(b'\n'.join([
+        b'{"op":"put","event":{"id":"no-times","title":"x"}}',
+        b'[1, 2]',
+        b'{"op":"put","event":"not an object"}',
+        b'{"op":"del"}',
+        orjson.dumps(good),
+    ]) + b'\n')
+
+    app = load_app()
+    assert set(app.events_by_id)=={'good'}
+    assert b'no-times' in (tmp_path / 'events.quarantine.log').read_bytes()